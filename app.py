@@ -1,14 +1,47 @@
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
-import json
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from pathlib import Path
+from urllib.parse import quote
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+import hashlib
+import orjson
+import os
+import re
+import threading
+import time
 
 # -----------------------
 # CONFIG
 # -----------------------
 MODEL_NAME = "llama-3.2-70b-versatile"  # use your model
 BASE_URL = "https://api.groq.com/openai/v1"
+# (connect, read) seconds: fail fast on a dead host, but give generation time to produce bytes
+GROQ_TIMEOUT = (3.05, 20)
+WIKI_TIMEOUT = (2, 5)
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
+WIKI_BATCH_SIZE = 20  # TextExtracts returns at most 20 intro extracts per request
+WIKI_WAIT_SECONDS = 3  # past this, stop waiting on Wikipedia and let Groq write the description
+WIKI_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/"
+WIKI_CACHE_PATH = Path(".cache/wikipedia.sqlite")
+WIKI_CACHE_TTL = 24 * 60 * 60  # articles change on the order of days
+LLM_CACHE_DIR = Path(".cache/groq")  # completions survive app restarts
+LLM_MEMORY_CACHE_SIZE = 512  # hot completions kept in memory in front of the disk cache
+LLM_CACHE_TTL = 24 * 60 * 60  # same lifetime as the st.cache_data layer, so expiring there really refetches
+LLM_CACHE_MAX_FILES = 2000  # past this, the oldest completions are evicted from disk
+LLM_CACHE_PRUNE_INTERVAL = 10 * 60  # seconds between disk sweeps, so writes don't list the directory every time
+
+# Every Groq call starts with this exact system message and puts the company-specific text at the end of the
+# user message, so requests share the longest possible identical prefix for provider-side prompt caching.
+ANALYST_SYSTEM_PROMPT = (
+    "You are a business analyst who researches companies and recommends AI/ML/GenAI opportunities. "
+    "Be concise and factual. When asked for a list, put one item per line with no extra commentary."
+)
 
 st.set_page_config(page_title="AI Use Case Generator", page_icon="🤖")
 
@@ -24,13 +57,97 @@ HEADERS = {
 }
 
 
+@st.cache_resource
+def wiki_session() -> requests.Session:
+    """Shared keep-alive session for Wikipedia; responses are cached on disk so restarts don't refetch them."""
+    session = CachedSession(
+        str(WIKI_CACHE_PATH),
+        backend="sqlite",
+        expire_after=WIKI_CACHE_TTL,
+        allowable_codes=(200,),
+        allowable_methods=("GET",),
+    )
+    session.headers.update({"User-Agent": "AI-Agent/1.0"})
+    return session
+
+
+@st.cache_resource
+def groq_session() -> requests.Session:
+    """Pooled keep-alive session for Groq, so each completion reuses a warm TLS connection."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retries = Retry(
+        total=2,
+        read=0,  # a read timeout/error may mean Groq is mid-generation: resending would bill twice and stall the UI
+        other=0,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST"],  # chat completions are safe to resend after a 429/5xx
+        raise_on_status=False,  # hand the last response back so its HTTP status is reported as before
+        respect_retry_after_header=True,  # back off as long as Groq asks on 429
+    )
+    # run_many fans out up to 8 companies x 2 concurrent calls
+    session.mount("https://", HTTPAdapter(pool_maxsize=16, max_retries=retries))
+    return session
+
+
+def fetch_wiki_summaries(company_names: List[str]) -> Dict[str, str]:
+    """Fetch the first intro paragraph for many Wikipedia pages, one API request per WIKI_BATCH_SIZE titles.
+
+    Names without a usable page are simply missing from the result.
+    """
+    summaries = {}
+    for start in range(0, len(company_names), WIKI_BATCH_SIZE):
+        chunk = company_names[start:start + WIKI_BATCH_SIZE]
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "prop": "extracts|pageprops",
+            "ppprop": "disambiguation",
+            "exintro": "1",
+            "explaintext": "1",
+            "exlimit": "max",
+            "redirects": "1",
+            "titles": "|".join(chunk),
+        }
+        try:
+            resp = wiki_session().get(WIKI_API_URL, params=params, timeout=WIKI_TIMEOUT)
+            resp.raise_for_status()
+            query = orjson.loads(resp.content).get("query", {})
+        except (requests.RequestException, ValueError):
+            continue
+
+        # requested names come back under their normalized / redirect-target titles
+        normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+        redirects = {r["from"]: r["to"] for r in query.get("redirects", [])}
+        # a disambiguation page's extract is just "X may refer to:", same as the REST summary check
+        extracts = {
+            page.get("title"): page.get("extract") or ""
+            for page in query.get("pages", [])
+            if "disambiguation" not in (page.get("pageprops") or {})
+        }
+        for name in chunk:
+            title = normalized.get(name, name)
+            title = redirects.get(title, title)
+            first_para = extracts.get(title, "").strip().split("\n", 1)[0].strip()
+            if first_para:
+                summaries[name] = first_para
+    return summaries
+
+
 # -----------------------
 # Helper: call Groq chat completions (OpenAI-compatible endpoint)
 # -----------------------
 def extract_content(resp_json: dict) -> str:
     """Robustly extract assistant text from Groq/OpenAI-compatible response."""
+    # happy path: virtually every chat completion has this shape
+    try:
+        return resp_json["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        pass
     if not isinstance(resp_json, dict):
-        return json.dumps(resp_json)
+        return orjson.dumps(resp_json).decode()
     choices = resp_json.get("choices") or []
     if choices:
         first = choices[0]
@@ -51,11 +168,118 @@ def extract_content(resp_json: dict) -> str:
         if isinstance(val, str):
             return val
     # last resort: stringify whole response
-    return json.dumps(resp_json)
+    return orjson.dumps(resp_json).decode()
+
+
+def _normalize_prompt(text: str) -> str:
+    # prompts differing only in case/whitespace (" tesla " vs "Tesla") get the same answer
+    return " ".join(text.split()).casefold()
+
+
+def _llm_cache_key(payload: Dict) -> str:
+    messages = [{**m, "content": _normalize_prompt(m.get("content", ""))} for m in payload["messages"]]
+    keyed = {**payload, "messages": messages}
+    return hashlib.sha256(orjson.dumps(keyed, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+@st.cache_resource
+def _llm_memory_cache() -> Tuple[threading.Lock, "OrderedDict[str, Tuple[str, float]]"]:
+    return threading.Lock(), OrderedDict()
+
+
+def _llm_cache_get(payload: Dict) -> Optional[str]:
+    key = _llm_cache_key(payload)
+    # the in-memory LRU only holds deterministic (temperature=0) completions
+    deterministic = payload.get("temperature") == 0
+    if deterministic:
+        lock, memory = _llm_memory_cache()
+        with lock:
+            entry = memory.get(key)
+            if entry is not None and time.time() - entry[1] < LLM_CACHE_TTL:
+                memory.move_to_end(key)
+                return entry[0]
+
+    path = LLM_CACHE_DIR / f"{key}.txt"
+    try:
+        stored_at = path.stat().st_mtime
+        if time.time() - stored_at >= LLM_CACHE_TTL:
+            return None  # expired; the next successful call overwrites it
+        content = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    if deterministic:
+        _llm_memory_put(key, content, stored_at)
+    return content
+
+
+def _llm_memory_put(key: str, content: str, stored_at: float) -> None:
+    lock, memory = _llm_memory_cache()
+    with lock:
+        memory[key] = (content, stored_at)
+        memory.move_to_end(key)
+        while len(memory) > LLM_MEMORY_CACHE_SIZE:
+            memory.popitem(last=False)
+
+
+def _llm_cache_set(payload: Dict, content: Optional[str]) -> None:
+    if not isinstance(content, str):
+        return  # e.g. a null message.content; nothing worth caching
+    key = _llm_cache_key(payload)
+    if payload.get("temperature") == 0:
+        _llm_memory_put(key, content, time.time())
+
+    path = LLM_CACHE_DIR / f"{key}.txt"
+    tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write-then-rename so a concurrent reader never sees a partial entry
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)  # the cache is best-effort; never fail the request over it
+    _maybe_prune_llm_cache()
+
+
+@st.cache_resource
+def _llm_prune_state() -> Dict[str, float]:
+    return {"last": 0.0}
+
+
+def _maybe_prune_llm_cache() -> None:
+    """Every LLM_CACHE_PRUNE_INTERVAL, drop expired entries and leftover temp files, then cap the entry count."""
+    state = _llm_prune_state()
+    now = time.time()
+    if now - state["last"] < LLM_CACHE_PRUNE_INTERVAL:
+        return
+    state["last"] = now
+
+    entries = []
+    try:
+        for path in LLM_CACHE_DIR.iterdir():
+            try:
+                age = now - path.stat().st_mtime
+                # a .tmp that old was left behind by a write that died before its rename
+                if age >= LLM_CACHE_TTL or (path.suffix == ".tmp" and age >= LLM_CACHE_PRUNE_INTERVAL):
+                    path.unlink()
+                elif path.suffix == ".txt":
+                    entries.append((age, path))
+            except OSError:
+                continue  # raced with another writer/pruner
+    except OSError:
+        return
+
+    if len(entries) > LLM_CACHE_MAX_FILES:
+        entries.sort(reverse=True)  # oldest first
+        for _, path in entries[:len(entries) - LLM_CACHE_MAX_FILES]:
+            path.unlink(missing_ok=True)
 
 
 def groq_chat_completion(
-    messages: List[Dict], model: str = MODEL_NAME, max_tokens: int = 512, temperature: float = 0.0
+    messages: List[Dict],
+    model: str = MODEL_NAME,
+    max_tokens: int = 512,
+    temperature: float = 0.0,
+    response_format: Optional[Dict] = None,
 ) -> Optional[str]:
     payload = {
         "model": model,
@@ -63,8 +287,14 @@ def groq_chat_completion(
         "max_tokens": max_tokens,
         "temperature": temperature,
     }
+    if response_format:
+        payload["response_format"] = response_format
+    cached = _llm_cache_get(payload)
+    if cached is not None:
+        return cached
+
     try:
-        resp = requests.post(f"{BASE_URL}/chat/completions", headers=HEADERS, json=payload, timeout=30)
+        resp = groq_session().post(f"{BASE_URL}/chat/completions", data=orjson.dumps(payload), timeout=GROQ_TIMEOUT)
     except requests.RequestException as e:
         st.error(f"Network error when contacting Groq API: {e}")
         return None
@@ -75,26 +305,228 @@ def groq_chat_completion(
         return None
 
     try:
-        data = resp.json()
+        data = orjson.loads(resp.content)
     except ValueError:
         st.error("Unable to decode response from Groq API (invalid JSON).")
         return None
 
-    return extract_content(data)
+    content = extract_content(data)
+    _llm_cache_set(payload, content)
+    return content
+
+
+class StreamInterrupted(Exception):
+    """A Groq stream broke off after yielding part of the answer, so what was received is truncated."""
+
+
+def groq_chat_completion_stream(
+    messages: List[Dict], model: str = MODEL_NAME, max_tokens: int = 512, temperature: float = 0.0
+) -> Iterator[str]:
+    """Like groq_chat_completion, but yields content deltas as Groq streams them (server-sent events).
+
+    Raises StreamInterrupted if the stream stops before Groq's "[DONE]" marker.
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+    }
+    # look up with the non-streaming payload so both variants share cache entries
+    cached = _llm_cache_get(payload)
+    if cached is not None:
+        yield cached
+        return
+
+    try:
+        resp = groq_session().post(
+            f"{BASE_URL}/chat/completions", data=orjson.dumps({**payload, "stream": True}), timeout=GROQ_TIMEOUT, stream=True
+        )
+    except requests.RequestException as e:
+        st.error(f"Network error when contacting Groq API: {e}")
+        return
+
+    with resp:
+        if resp.status_code != 200:
+            st.error(f"Groq API returned HTTP {resp.status_code}: {resp.text[:200]}")
+            return
+
+        parts = []
+        done = False
+        try:
+            for raw in resp.iter_lines():
+                line = raw.decode("utf-8")
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    done = True
+                    break
+                try:
+                    chunk = orjson.loads(data)
+                except ValueError:
+                    continue
+                choices = chunk.get("choices") or []
+                delta = (choices[0].get("delta") or {}).get("content") if choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except requests.RequestException as e:
+            raise StreamInterrupted(f"Groq stream was interrupted: {e}") from e
+        if not done:
+            raise StreamInterrupted("Groq stream ended before the answer was complete.")
+
+    if parts:
+        _llm_cache_set(payload, "".join(parts))
+
+
+@st.cache_resource
+def background_pool() -> ThreadPoolExecutor:
+    """Long-lived pool for work that may outlive the caller (e.g. a slow Wikipedia fetch we stopped waiting on)."""
+    return ThreadPoolExecutor(max_workers=8)
+
+
+def run_in_parallel(*calls: Callable[[], object], max_workers: Optional[int] = None) -> List:
+    """Run independent blocking calls (e.g. Groq requests) on worker threads and return results in order."""
+    # worker threads need the script context, otherwise st.error calls made there are dropped
+    ctx = get_script_run_ctx()
+
+    def with_ctx(fn: Callable[[], object]):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers or len(calls), len(calls))) as pool:
+        futures = [pool.submit(with_ctx, fn) for fn in calls]
+        return [f.result() for f in futures]
+
+
+def analyst_messages(prompt: str) -> List[Dict]:
+    """Chat messages for a task prompt: shared system prefix first, task-specific text last."""
+    return [{"role": "system", "content": ANALYST_SYSTEM_PROMPT}, {"role": "user", "content": prompt}]
+
+
+@st.cache_resource
+def _inflight_registry() -> Tuple[threading.Lock, Dict[Hashable, Future]]:
+    # cache_resource, not a module global: Streamlit re-executes this script per rerun and session
+    return threading.Lock(), {}
+
+
+def _join_flight(key: Hashable) -> Tuple[Future, bool]:
+    """Return the in-flight Future for key, and whether the caller just created it (and so must resolve it)."""
+    lock, inflight = _inflight_registry()
+    with lock:
+        future = inflight.get(key)
+        if future is not None:
+            return future, False
+        future = inflight[key] = Future()
+        return future, True
+
+
+def _leave_flight(key: Hashable, future: Future) -> None:
+    lock, inflight = _inflight_registry()
+    with lock:
+        if inflight.get(key) is future:
+            del inflight[key]
+
+
+# result of a flight whose owner was interrupted; waiters then race to run the work themselves
+_ABANDONED = object()
+
+
+def single_flight(key: Hashable, fn: Callable[[], object]):
+    """Call fn() at most once per key at a time; concurrent callers with the same key wait for and share its result."""
+    while True:
+        future, owner = _join_flight(key)
+        if owner:
+            break
+        result = future.result()
+        if result is not _ABANDONED:
+            return result
+
+    # unregister before resolving, so woken waiters never see the finished future
+    try:
+        result = fn()
+    except Exception as e:
+        _leave_flight(key, future)
+        future.set_exception(e)
+        raise
+    except BaseException:
+        # e.g. Streamlit's StopException/RerunException: control flow for the owner's session only
+        _leave_flight(key, future)
+        future.set_result(_ABANDONED)
+        raise
+    _leave_flight(key, future)
+    future.set_result(result)
+    return result
+
+
+def single_flight_stream(key: Hashable, make_stream: Callable[[], Iterator[str]]) -> Iterator[str]:
+    """single_flight for text streams: the first caller streams live, concurrent duplicates get the full text at the end.
+
+    If the first stream fails or is abandoned midway, one waiting caller takes over and streams again.
+    """
+    while True:
+        future, owner = _join_flight(key)
+        if owner:
+            break
+        text = future.result()
+        if text:
+            yield text
+            return
+        # the owner came up empty: loop so only one waiter becomes the new owner
+
+    parts = []
+    completed = False
+    try:
+        for part in make_stream():
+            parts.append(part)
+            yield part
+        completed = True
+    finally:
+        # unregister before resolving, and never hand a truncated answer to the waiters
+        _leave_flight(key, future)
+        future.set_result("".join(parts) if completed else "")
+
+
+def company_key(company_name: str) -> str:
+    """Case/whitespace-insensitive identity of a company name, for de-duplicating work."""
+    return " ".join(company_name.split()).casefold()
+
+
+_BULLET_RE = re.compile(r"^[-•*0-9. )\s]+")
 
 
 def clean_list_lines(text: str) -> List[str]:
     if not text:
         return []
-    lines = []
-    for l in text.splitlines():
-        l = l.strip()
-        if not l:
-            continue
-        # drop leading bullets/numbers
-        l = l.lstrip("-•*0123456789. )")
-        lines.append(l.strip())
-    return lines
+    # drop leading bullets/numbers; lines that are nothing but a bullet disappear
+    return [s for s in (_BULLET_RE.sub("", line).strip() for line in text.splitlines()) if s]
+
+
+def as_str_list(value) -> List[str]:
+    """Normalize a JSON field that should be a list of strings (models sometimes return one string)."""
+    if isinstance(value, str):
+        return clean_list_lines(value)
+    if isinstance(value, list):
+        # one str()/strip() per item: the walrus keeps the stripped value for the result
+        return [item for v in value if (item := str(v).strip())]
+    return []
+
+
+class IncompleteResult(Exception):
+    """Raised out of a st.cache_data function so a result degraded by a transient failure is used but not cached."""
+
+    def __init__(self, value):
+        super().__init__("result degraded by a failed upstream call; not cached")
+        self.value = value
+
+
+def uncached_on_failure(fn: Callable, *args):
+    """Call a cached pipeline step, returning the degraded value of an IncompleteResult instead of raising."""
+    try:
+        return fn(*args)
+    except IncompleteResult as e:
+        return e.value
 
 
 # -----------------------
@@ -104,113 +536,309 @@ class WebBrowserTools:
     def __init__(self, model: str = MODEL_NAME):
         self.model = model
 
-    def scrape_company_info(self, company_name: str) -> Dict:
-        description = None
+    def scrape_company_info(self, company_name: str, description: Optional[str] = None) -> Dict:
+        """Research a company.
+
+        Raises IncompleteResult (carrying the partial info) when Wikipedia timed out or a Groq call failed,
+        so cached callers don't keep a transient failure around for a whole TTL.
+        """
+        wiki_timed_out = False
+        if description is None:
+            # bound the total wait: a slow Wikipedia response shouldn't hold up the Groq call behind it
+            wiki_future = background_pool().submit(self.fetch_wiki_description, company_name)
+            done, _ = wait([wiki_future], timeout=WIKI_WAIT_SECONDS)
+            description = wiki_future.result() if done else None
+            wiki_timed_out = not done
+
+        not_found = f"{company_name} - description not found."
+        bundle = self.fetch_company_bundle(company_name, description)
+        if bundle is not None:
+            description = description or bundle["description"] or not_found
+            offerings, focus = bundle["offerings"], bundle["focus"]
+        else:
+            # model ignored JSON mode: fall back to one prompt per field
+            if not description:
+                description = self.generate_description_with_groq(company_name) or not_found
+            # offerings and focus areas are independent prompts: overlap the two Groq round-trips
+            offerings, focus = run_in_parallel(
+                lambda: self.generate_offerings(description),
+                lambda: self.generate_focus_areas(description),
+            )
+
+        info = {
+            "company": company_name,
+            "description": description,
+            "offerings": offerings,
+            "focus": focus,
+        }
+        # a missing description or no lists at all means a Groq call failed (already reported via st.error)
+        if wiki_timed_out or description == not_found or not (offerings or focus):
+            raise IncompleteResult(info)
+        return info
+
+    def fetch_wiki_description(self, company_name: str) -> Optional[str]:
+        # the REST summary is a few KB of JSON with the lead paragraph, vs hundreds of KB of article HTML
         try:
-            url = f"https://en.wikipedia.org/wiki/{company_name.replace(' ', '_')}"
-            resp = requests.get(url, timeout=8)
+            url = WIKI_SUMMARY_URL + quote(company_name.strip().replace(" ", "_"), safe="")
+            resp = wiki_session().get(url, timeout=WIKI_TIMEOUT)
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                para = soup.find("p")
-                if para and para.get_text(strip=True):
-                    description = para.get_text().strip()
+                data = orjson.loads(resp.content)
+                # a disambiguation page's extract is just "X may refer to:"
+                if data.get("type") != "disambiguation":
+                    return (data.get("extract") or "").strip() or None
         except Exception:
-            description = None
-
-        if not description:
-            description = self.generate_description_with_groq(company_name) or f"{company_name} - description not found."
-
-        offerings = self.generate_offerings(description)
-        focus = self.generate_focus_areas(description)
+            pass
+        return None
 
+    def fetch_company_bundle(self, company_name: str, description: Optional[str]) -> Optional[Dict]:
+        """Get offerings, focus areas and (only if none was given) a description from a single JSON-mode Groq call.
+
+        Returns None only when the model output can't be parsed, so the caller can retry per field;
+        an API failure (already reported via st.error) yields an empty bundle instead.
+        """
+        lists = (
+            '"offerings" (list of at most 5 main offerings/products/services) and '
+            '"focus_areas" (list of at most 5 strategic focus areas, e.g. AI, Cloud, Healthcare).'
+        )
+        if description:
+            # Wikipedia already gave us the description; don't pay for output we'd throw away
+            prompt = f"Respond with a JSON object with the keys {lists}\n\nCompany: {company_name}"
+            prompt += f"\n\nDescription:\n{description}"
+            max_tokens = 300
+        else:
+            prompt = (
+                "Respond with a JSON object with the keys "
+                f'"description" (a 2-3 line professional description of the company), {lists}'
+                f"\n\nCompany: {company_name}"
+            )
+            max_tokens = 400
+        messages = analyst_messages(prompt)
+        out = groq_chat_completion(
+            messages, model=self.model, max_tokens=max_tokens, temperature=0.0, response_format={"type": "json_object"}
+        )
+        if out is None:
+            return {"description": None, "offerings": [], "focus": []}
+        try:
+            data = orjson.loads(out)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        desc = data.get("description")
         return {
-            "company": company_name,
-            "description": description,
-            "offerings": offerings,
-            "focus": focus,
+            "description": desc.strip() if isinstance(desc, str) else None,
+            "offerings": as_str_list(data.get("offerings")),
+            "focus": as_str_list(data.get("focus_areas")),
         }
 
     def generate_description_with_groq(self, company_name: str) -> Optional[str]:
-        prompt = f"Write a 2-3 line professional description about {company_name}."
-        messages = [{"role": "user", "content": prompt}]
+        messages = analyst_messages(f"Write a 2-3 line professional description of this company.\n\nCompany: {company_name}")
         return groq_chat_completion(messages, model=self.model, max_tokens=200, temperature=0.0)
 
     def generate_offerings(self, description: str) -> List[str]:
         prompt = f"From this description, list the main offerings/products/services (one per line):\n\n{description}"
-        messages = [{"role": "user", "content": prompt}]
+        messages = analyst_messages(prompt)
         out = groq_chat_completion(messages, model=self.model, max_tokens=250, temperature=0.0) or ""
         return clean_list_lines(out)
 
     def generate_focus_areas(self, description: str) -> List[str]:
-        prompt = f"From this description, what strategic focus areas does the company have? (e.g., AI, Cloud, Healthcare). List one per line."
-        messages = [{"role": "user", "content": prompt}]
+        prompt = f"From this description, what strategic focus areas does the company have? (e.g., AI, Cloud, Healthcare). List one per line.\n\n{description}"
+        messages = analyst_messages(prompt)
         out = groq_chat_completion(messages, model=self.model, max_tokens=200, temperature=0.0) or ""
         return clean_list_lines(out)
 
 
+# -----------------------
+# CACHED PIPELINE STEPS
+# -----------------------
+CACHE_TTL = 24 * 60 * 60  # company info and use cases rarely change within a day
+USE_CASE_MAX_TOKENS = 400  # 5 use cases x 1-2 sentences fits comfortably; a tighter cap ends decoding sooner
+MAX_PARALLEL_COMPANIES = 8  # keeps a multi-company request from flooding Groq's rate limit
+
+
+@st.cache_resource
+def get_browser_tools() -> WebBrowserTools:
+    # stateless apart from the model name, so every cache miss can share one instance
+    return WebBrowserTools()
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_research(company_name: str, description: Optional[str] = None) -> Dict:
+    return get_browser_tools().scrape_company_info(company_name, description)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_use_cases(company_name: str, description: str) -> List[str]:
+    out = groq_chat_completion(
+        use_case_json_messages(description),
+        model=MODEL_NAME,
+        max_tokens=USE_CASE_MAX_TOKENS,
+        temperature=0.2,
+        response_format={"type": "json_object"},
+    ) or ""
+    cases = parse_use_cases(out)
+    if not cases:
+        # Groq failed: retry on the next rerun rather than serving [] for a whole TTL
+        raise IncompleteResult(cases)
+    return cases
+
+
+def use_case_messages(description: str) -> List[Dict]:
+    prompt = (
+        "Suggest 5 AI/GenAI/ML use cases for the following company. "
+        f"List each use case on a new line with a 1-2 sentence explanation.\n\n{description}"
+    )
+    return analyst_messages(prompt)
+
+
+def use_case_json_messages(description: str) -> List[Dict]:
+    prompt = (
+        "Suggest 5 AI/GenAI/ML use cases for the following company. "
+        'Respond with a JSON object {"use_cases": [{"title": ..., "desc": ...}]} with exactly 5 items, '
+        f"each desc 1-2 sentences.\n\n{description}"
+    )
+    return analyst_messages(prompt)
+
+
+def parse_use_cases(text: str) -> List[str]:
+    """Turn a JSON-mode use-case answer into "title: desc" lines; plain-text answers fall back to line splitting."""
+    try:
+        items = orjson.loads(text).get("use_cases")
+    except (ValueError, AttributeError):
+        return clean_list_lines(text)
+    if not isinstance(items, list):
+        return clean_list_lines(text)
+
+    cases = []
+    for item in items:
+        if isinstance(item, dict):
+            title, desc = str(item.get("title") or "").strip(), str(item.get("desc") or "").strip()
+            line = f"{title}: {desc}" if title and desc else title or desc
+        else:
+            line = str(item).strip()
+        if line:
+            cases.append(line)
+    return cases
+
+
 # -----------------------
 # AGENTS & ORCHESTRATOR
 # -----------------------
 class ResearchAgent:
-    def __init__(self):
-        self.browser_tools = WebBrowserTools()
-
-    def research_company(self, company_name: str) -> Dict:
-        return self.browser_tools.scrape_company_info(company_name)
+    def research_company(self, company_name: str, description: Optional[str] = None) -> Dict:
+        """Research a company; pass a known description (e.g. from a batched Wikipedia lookup) to skip the scrape."""
+        # st.cache_data already serializes identical keys; this also coalesces " Tesla" / "tesla" lookups in flight
+        return single_flight(
+            ("research", company_key(company_name), description),
+            lambda: uncached_on_failure(_cached_research, company_name, description),
+        )
 
 
 class MarketAnalysisAgent:
     def generate_use_cases(self, company_info: Dict) -> List[str]:
-        description = company_info.get("description", "")
-        prompt = f"Suggest 5 AI/GenAI/ML use cases for the following company.\n\n{description}\n\nList each use case on a new line with a 1-2 sentence explanation."
-        messages = [{"role": "user", "content": prompt}]
-        out = groq_chat_completion(messages, model=MODEL_NAME, max_tokens=600, temperature=0.2) or ""
-        return clean_list_lines(out)
+        company_name, description = company_info.get("company", ""), company_info.get("description", "")
+        return single_flight(
+            ("use_cases", company_key(company_name), description),
+            lambda: uncached_on_failure(_cached_use_cases, company_name, description),
+        )
+
+    def stream_use_cases(self, company_info: Dict) -> Iterator[str]:
+        """Yield the use-case text as it is generated, for st.write_stream."""
+        company_name, description = company_info.get("company", ""), company_info.get("description", "")
+        messages = use_case_messages(description)
+        # a duplicate submit waits for the stream already in flight instead of paying for a second completion
+        return single_flight_stream(
+            ("use_cases_stream", company_key(company_name), description),
+            lambda: groq_chat_completion_stream(messages, model=MODEL_NAME, max_tokens=USE_CASE_MAX_TOKENS, temperature=0.2),
+        )
 
 
 class MultiAgentSystem:
+    __slots__ = ("research_agent", "market_agent")
+
     def __init__(self):
         self.research_agent = ResearchAgent()
         self.market_agent = MarketAnalysisAgent()
 
-    def run(self, company_name: str) -> Dict:
-        company_info = self.research_agent.research_company(company_name)
+    def run(self, company_name: str, description: Optional[str] = None) -> Dict:
+        company_info = self.research_agent.research_company(company_name, description)
         use_cases = self.market_agent.generate_use_cases(company_info)
         return {"company_info": company_info, "use_cases": use_cases}
 
+    def run_many(self, company_names: List[str]) -> List[Dict]:
+        """Run the pipeline for several companies concurrently; results keep the input order."""
+        # one batched Wikipedia lookup instead of a page scrape per company
+        summaries = fetch_wiki_summaries(company_names)
+        return run_in_parallel(
+            *[lambda name=name: self.run(name, summaries.get(name)) for name in company_names],
+            max_workers=MAX_PARALLEL_COMPANIES,
+        )
+
 
 # -----------------------
 # STREAMLIT UI
 # -----------------------
-st.title("🤖 Multi-Agent AI Use Case Generator")
-company_name = st.text_input("Enter a company name to generate AI/ML/GenAI use cases and resources:")
+@st.cache_resource
+def get_orchestrator() -> MultiAgentSystem:
+    # the agents hold no per-request state, so one instance can serve every rerun and session
+    return MultiAgentSystem()
 
-if company_name:
-    orchestrator = MultiAgentSystem()
-    with st.spinner("Agents are running..."):
-        results = orchestrator.run(company_name)
 
-    if results:
-        st.success("✅ Completed!")
-        info = results["company_info"]
-
-        st.subheader("📄 Company Information")
-        st.write(f"**Company:** {info.get('company')}")
-        st.write(f"**Description:** {info.get('description')}")
-        st.write("**Offerings:**")
-        st.write(info.get("offerings", []))
-        st.write("**Strategic Focus Areas:**")
-        st.write(info.get("focus", []))
-
-        st.subheader("🚀 AI/GenAI Use Cases")
-        for case in results.get("use_cases", []):
-            st.write("-", case)
-    else:
-        st.error("No results returned. Check the Groq API key and logs for more details.")
+def render_company_info(info: Dict) -> None:
+    st.subheader("📄 Company Information")
+    st.write(f"**Company:** {info.get('company')}")
+    st.write(f"**Description:** {info.get('description')}")
+    st.write("**Offerings:**")
+    st.write(info.get("offerings", []))
+    st.write("**Strategic Focus Areas:**")
+    st.write(info.get("focus", []))
 
 
+def render_results(results: Dict) -> None:
+    render_company_info(results["company_info"])
 
+    st.subheader("🚀 AI/GenAI Use Cases")
+    for case in results.get("use_cases", []):
+        st.write("-", case)
 
 
+st.title("🤖 Multi-Agent AI Use Case Generator")
+company_name = st.text_input("Enter a company name to generate AI/ML/GenAI use cases and resources:")
+with st.expander("Research several companies at once"):
+    # one per line: names like "Tesla, Inc." contain commas
+    many_names = st.text_area("Company names, one per line:")
 
+# collapse stray whitespace so "Tesla  Inc" and " Tesla Inc" share one cache entry
+company_names = [" ".join(name.split()) for name in many_names.splitlines() if name.strip()]
+if not company_names and company_name.strip():
+    company_names = [" ".join(company_name.split())]
+
+if len(company_names) == 1:
+    orchestrator = get_orchestrator()
+    with st.spinner("Agents are running..."):
+        info = orchestrator.research_agent.research_company(company_names[0])
 
+    render_company_info(info)
+    st.subheader("🚀 AI/GenAI Use Cases")
+    # render tokens as they arrive instead of waiting for the whole completion
+    try:
+        use_cases_text = st.write_stream(orchestrator.market_agent.stream_use_cases(info))
+    except StreamInterrupted as e:
+        st.error(f"{e} The use cases above are incomplete; rerun to try again.")
+    else:
+        st.session_state["use_cases_text"] = use_cases_text
+        if use_cases_text:
+            st.success("✅ Completed!")
+        else:
+            st.error("No results returned. Check the Groq API key and logs for more details.")
+elif company_names:
+    orchestrator = get_orchestrator()
+    with st.spinner("Agents are running..."):
+        all_results = orchestrator.run_many(company_names)
+
+    if all(all_results):
+        st.success("✅ Completed!")
+        for results in all_results:
+            render_results(results)
+    else:
+        st.error("No results returned. Check the Groq API key and logs for more details.")